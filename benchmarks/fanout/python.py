@@ -6,12 +6,55 @@ Output format: BENCH:fanout:<test>:<result>:<time_ms>
 """
 
 import asyncio
+import platform
+import sys
 import time
+from array import array
+
+try:
+    import uvloop
+
+    BACKEND = "uvloop"
+except ImportError:  # uvloop is optional; fall back to the default loop
+    BACKEND = "asyncio"
+    uvloop = None
 
 NUM_MESSAGES = 100_000
 NUM_WORKERS = 10
 
 
+class RingChan:
+    """Fixed-capacity int64 ring buffer with an asyncio.Event for wakeups.
+
+    Messages are stored unboxed in an array and put/get are plain index
+    updates, without asyncio.Queue's deque and waiter bookkeeping.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_head", "_tail", "_event")
+
+    def __init__(self, capacity):
+        self._buf = array("q", bytes(8 * capacity))
+        self._capacity = capacity
+        self._head = 0
+        self._tail = 0
+        self._event = asyncio.Event()
+
+    def put_nowait(self, val):
+        if self._tail - self._head == self._capacity:
+            raise asyncio.QueueFull
+        self._buf[self._tail % self._capacity] = val
+        self._tail += 1
+        self._event.set()
+
+    async def get(self):
+        while self._head == self._tail:
+            self._event.clear()
+            await self._event.wait()
+        val = self._buf[self._head % self._capacity]
+        self._head += 1
+        return val
+
+
 async def worker(work_queue, done_queue):
     count = 0
     while True:
@@ -20,16 +63,25 @@ async def worker(work_queue, done_queue):
             await done_queue.put(count)
             break
         count += 1
-        await asyncio.sleep(0)  # yield
+        # get() never suspends while messages remain, so yield periodically
+        # or the first worker to wake would take every message
+        if count & 1023 == 0:
+            await asyncio.sleep(0)
 
 
-async def producer(work_queue, count):
+def producer(work_queue, count):
+    # The channel holds every message, so puts never block
     for i in range(count):
-        await work_queue.put(i)
+        work_queue.put_nowait(i)
 
 
 async def main():
-    work_queue = asyncio.Queue()
+    print(f"BACKEND:fanout:{BACKEND}:{platform.python_version()}", file=sys.stderr)
+
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    work_queue = RingChan(NUM_MESSAGES + NUM_WORKERS)
     done_queue = asyncio.Queue()
 
     # Spawn workers
@@ -41,11 +93,11 @@ async def main():
     start = time.perf_counter_ns()
 
     # Produce messages
-    await producer(work_queue, NUM_MESSAGES)
+    producer(work_queue, NUM_MESSAGES)
 
     # Send sentinels
     for _ in range(NUM_WORKERS):
-        await work_queue.put(-1)
+        work_queue.put_nowait(-1)
 
     # Collect results
     total = 0
@@ -61,4 +113,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
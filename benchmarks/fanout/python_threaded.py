@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Fanout Benchmark - Python threaded implementation
+Output format: BENCH:fanout:<test>:<result>:<time_ms>
+
+1 producer, N consumer OS threads sharing a queue.SimpleQueue.
+On a free-threaded (PEP 703) build the workers run in parallel; with the
+GIL they still avoid asyncio's event-loop overhead.
+"""
+
+import queue
+import threading
+import time
+
+NUM_MESSAGES = 100_000
+NUM_WORKERS = 10
+
+
+def worker(work_queue, counts, idx):
+    count = 0
+    while True:
+        val = work_queue.get()
+        if val < 0:  # sentinel
+            break
+        count += 1
+    counts[idx] = count
+
+
+def main():
+    work_queue = queue.SimpleQueue()
+    counts = [0] * NUM_WORKERS
+
+    # Spawn workers
+    workers = [
+        threading.Thread(target=worker, args=(work_queue, counts, i))
+        for i in range(NUM_WORKERS)
+    ]
+    for t in workers:
+        t.start()
+
+    start = time.perf_counter_ns()
+
+    # Produce messages
+    for i in range(NUM_MESSAGES):
+        work_queue.put(i)
+
+    # Send sentinels
+    for _ in range(NUM_WORKERS):
+        work_queue.put(-1)
+
+    # Wait for workers
+    for t in workers:
+        t.join()
+    total = sum(counts)
+
+    elapsed = (time.perf_counter_ns() - start) // 1_000_000
+
+    print(f"BENCH:fanout:throughput-100k:{total}:{elapsed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,39 +2,76 @@
 """Pingpong Benchmark - Python implementation
 Output format: BENCH:pingpong:<test>:<result>:<time_ms>
 
-Uses asyncio queues for channel-like behavior.
+Uses a minimal single-consumer channel (deque + one waiter future) instead
+of asyncio.Queue, which carries waiter-list bookkeeping we don't need.
 Note: Python asyncio is single-threaded cooperative multitasking.
 """
 
 import asyncio
+import platform
+import sys
 import time
+from collections import deque
+
+try:
+    import uvloop
+
+    BACKEND = "uvloop"
+except ImportError:  # uvloop is optional; fall back to the default loop
+    BACKEND = "asyncio"
+    uvloop = None
 
 ITERATIONS = 100_000
 
 
-async def pong(ping_queue, pong_queue, count):
+class Channel:
+    """Unbounded channel with exactly one receiver."""
+
+    __slots__ = ("_items", "_waiter")
+
+    def __init__(self):
+        self._items = deque()
+        self._waiter = None
+
+    def send(self, val):
+        self._items.append(val)
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            waiter.set_result(None)
+
+    async def recv(self):
+        if not self._items:
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+        return self._items.popleft()
+
+
+async def pong(ping_chan, pong_chan, count):
     for _ in range(count):
-        val = await ping_queue.get()
-        await pong_queue.put(val)
+        val = await ping_chan.recv()
+        pong_chan.send(val)
 
 
-async def ping(ping_queue, pong_queue, count):
+async def ping(ping_chan, pong_chan, count):
     for i in range(count):
-        await ping_queue.put(i)
-        await pong_queue.get()
+        ping_chan.send(i)
+        await pong_chan.recv()
 
 
 async def main():
-    ping_queue = asyncio.Queue()
-    pong_queue = asyncio.Queue()
+    print(f"BACKEND:pingpong:{BACKEND}:{platform.python_version()}", file=sys.stderr)
+
+    ping_chan = Channel()
+    pong_chan = Channel()
 
     start = time.perf_counter_ns()
 
     # Start pong task
-    pong_task = asyncio.create_task(pong(ping_queue, pong_queue, ITERATIONS))
+    pong_task = asyncio.create_task(pong(ping_chan, pong_chan, ITERATIONS))
 
     # Run ping
-    await ping(ping_queue, pong_queue, ITERATIONS)
+    await ping(ping_chan, pong_chan, ITERATIONS)
 
     # Wait for pong to finish
     await pong_task
@@ -45,4 +82,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
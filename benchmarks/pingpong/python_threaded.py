@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Pingpong Benchmark - Python threaded implementation
+Output format: BENCH:pingpong:<test>:<result>:<time_ms>
+
+Two OS threads exchanging messages over a pair of queue.SimpleQueue.
+On a free-threaded (PEP 703) build the threads run without the GIL.
+"""
+
+import queue
+import threading
+import time
+
+ITERATIONS = 100_000
+
+
+def pong(ping_queue, pong_queue, count):
+    for _ in range(count):
+        val = ping_queue.get()
+        pong_queue.put(val)
+
+
+def ping(ping_queue, pong_queue, count):
+    for i in range(count):
+        ping_queue.put(i)
+        pong_queue.get()
+
+
+def main():
+    ping_queue = queue.SimpleQueue()
+    pong_queue = queue.SimpleQueue()
+
+    start = time.perf_counter_ns()
+
+    # Start pong thread
+    pong_thread = threading.Thread(
+        target=pong, args=(ping_queue, pong_queue, ITERATIONS)
+    )
+    pong_thread.start()
+
+    # Run ping
+    ping(ping_queue, pong_queue, ITERATIONS)
+
+    # Wait for pong to finish
+    pong_thread.join()
+
+    elapsed = (time.perf_counter_ns() - start) // 1_000_000
+
+    print(f"BENCH:pingpong:roundtrip-100k:{ITERATIONS}:{elapsed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 """Primes Benchmark - Python implementation
 Output format: BENCH:primes:<test>:<result>:<time_ms>
+
+Compiled with numba's @njit when it is installed; otherwise plain CPython.
+Explicit signatures make numba compile at import, and cache=True stores the
+machine code under __pycache__ so later runs load it instead of recompiling.
 """
 
+import platform
+import sys
 import time
-import math
 
+try:
+    from numba import njit
+
+    BACKEND = "numba"
+except ImportError:  # numba is optional; fall back to plain CPython
+    BACKEND = "cpython"
+
+    def njit(*args, **kwargs):
+        return lambda func: func
 
+
+@njit(["boolean(int64)"], cache=True)
 def is_prime(n):
     if n < 2:
         return False
@@ -14,12 +30,15 @@ def is_prime(n):
         return True
     if n % 2 == 0:
         return False
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
+    i = 3
+    while i * i <= n:
         if n % i == 0:
             return False
+        i += 2
     return True
 
 
+@njit(["int64(int64)"], cache=True)
 def count_primes(limit):
     count = 0
     for n in range(2, limit + 1):
@@ -28,7 +47,24 @@ def count_primes(limit):
     return count
 
 
+def count_primes_sieve(limit):
+    # Sieve of Eratosthenes: each strike-out is one strided slice store
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b"\x00\x00"
+    i = 2
+    while i * i <= limit:
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit + 1, i)))
+        i += 1
+    return sieve.count(1)
+
+
 def main():
+    print(f"BACKEND:primes:{BACKEND}:{platform.python_version()}", file=sys.stderr)
+
+    # Keep first-call dispatch overhead out of the timed sections
+    count_primes(10)
+
     # count-primes-10k
     start = time.perf_counter_ns()
     result = count_primes(10000)
@@ -41,6 +77,12 @@ def main():
     elapsed = (time.perf_counter_ns() - start) // 1_000_000
     print(f"BENCH:primes:count-100k:{result}:{elapsed}")
 
+    # sieve-100k (algorithmic baseline; count-* above stay trial division)
+    start = time.perf_counter_ns()
+    result = count_primes_sieve(100000)
+    elapsed = (time.perf_counter_ns() - start) // 1_000_000
+    print(f"BENCH:primes:sieve-100k:{result}:{elapsed}")
+
 
 if __name__ == "__main__":
     main()
@@ -137,9 +137,9 @@ print_table() {
     echo
 }
 
-print_table "fibonacci" "fib-naive-30" "fib-naive-35" "fib-fast-30" "fib-fast-50" "fib-naive-20-x1000" "fib-fast-20-x1000"
-print_table "collections" "build-100k" "map-double" "filter-evens" "fold-sum" "chain"
-print_table "primes" "count-10k" "count-100k"
+print_table "fibonacci" "fib-naive-30" "fib-naive-35" "fib-fast-30" "fib-fast-50" "fib-naive-20-x1000" "fib-memo-20-x1000" "fib-fast-20-x1000"
+print_table "collections" "build-100k" "map-double" "filter-evens" "fold-sum" "chain" "chain-closed-form"
+print_table "primes" "count-10k" "count-100k" "sieve-100k"
 print_table "skynet" "spawn-100k"
 print_table "pingpong" "roundtrip-100k"
 print_table "fanout" "throughput-100k"
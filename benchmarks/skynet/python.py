@@ -8,26 +8,47 @@ not true parallelism like Go goroutines or Seq strands.
 """
 
 import asyncio
+import platform
+import sys
 import time
 
+try:
+    import uvloop
+
+    BACKEND = "uvloop"
+except ImportError:  # uvloop is optional; fall back to the default loop
+    BACKEND = "asyncio"
+    uvloop = None
+
 # Reduced size for Python (asyncio has more overhead)
 SIZE = 100_000
 
+# Subtrees at or below this size are summed directly instead of spawned
+# (cf. PARALLEL_THRESHOLD in rust.rs); 10 drops the 100k size-1 leaves,
+# but ~11k tasks are still spawned, including the 10k size-10 nodes
+LEAF_THRESHOLD = 10
+
 
 async def skynet(num: int, size: int) -> int:
-    if size == 1:
-        return num
+    if size <= LEAF_THRESHOLD:
+        # sum(range(num, num + size))
+        return size * (2 * num + size - 1) // 2
 
     child_size = size // 10
-    tasks = [
-        asyncio.create_task(skynet(num + i * child_size, child_size))
-        for i in range(10)
-    ]
-    results = await asyncio.gather(*tasks)
+    # gather() wraps the coroutines in tasks itself; with the eager task
+    # factory, children that finish without suspending never get scheduled
+    results = await asyncio.gather(
+        *[skynet(num + i * child_size, child_size) for i in range(10)]
+    )
     return sum(results)
 
 
 async def main():
+    print(f"BACKEND:skynet:{BACKEND}:{platform.python_version()}", file=sys.stderr)
+
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     start = time.perf_counter_ns()
     result = await skynet(0, SIZE)
     elapsed = (time.perf_counter_ns() - start) // 1_000_000
@@ -35,4 +56,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
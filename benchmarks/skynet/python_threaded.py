@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Skynet Benchmark - Python threaded implementation
+Output format: BENCH:skynet:<test>:<result>:<time_ms>
+
+Mirrors rust.rs: OS threads at the high levels of the tree, sequential
+recursion below PARALLEL_THRESHOLD. On a free-threaded (PEP 703) build
+the subtrees are summed in parallel.
+"""
+
+import queue
+import threading
+import time
+
+SIZE = 100_000
+PARALLEL_THRESHOLD = 1000
+
+
+def skynet_seq(num: int, size: int) -> int:
+    if size == 1:
+        return num
+
+    child_size = size // 10
+    total = 0
+    for i in range(10):
+        total += skynet_seq(num + i * child_size, child_size)
+    return total
+
+
+def skynet_par(num: int, size: int) -> int:
+    if size <= PARALLEL_THRESHOLD:
+        return skynet_seq(num, size)
+
+    child_size = size // 10
+    results = queue.SimpleQueue()
+
+    def child(child_num):
+        results.put(skynet_par(child_num, child_size))
+
+    threads = [
+        threading.Thread(target=child, args=(num + i * child_size,))
+        for i in range(10)
+    ]
+    for t in threads:
+        t.start()
+
+    total = 0
+    for _ in range(10):
+        total += results.get()
+
+    for t in threads:
+        t.join()
+
+    return total
+
+
+def main():
+    start = time.perf_counter_ns()
+    result = skynet_par(0, SIZE)
+    elapsed = (time.perf_counter_ns() - start) // 1_000_000
+    print(f"BENCH:skynet:spawn-100k:{result}:{elapsed}")
+
+
+if __name__ == "__main__":
+    main()